@@ -1,22 +1,38 @@
 """The CoinGecko integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
-from typing import Any
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
 
 import aiohttp
-from homeassistant.config_entries import ConfigEntry
+import orjson
+import yarl
+from homeassistant.config_entries import ConfigEntry, current_entry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.util import dt as dt_util
 
 from .const import (
     API_BASE_URL,
+    CACHE_TTL_PRICE,
+    CACHE_TTL_STALE,
     CONF_SCAN_INTERVAL,
     CONF_COIN_ID,
     CONF_CURRENCY,
+    DATA_COORDINATOR,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     SIMPLE_PRICE_ENDPOINT,
@@ -26,19 +42,71 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+_SIMPLE_PRICE_URL = yarl.URL(f"{API_BASE_URL}{SIMPLE_PRICE_ENDPOINT}")
+
+
+class Quote(NamedTuple):
+    """Price data of a single trading pair."""
+
+    price: float
+    coin_id: str
+    currency: str
+    change_24h: float | None
+    volume_24h: float | None
+    market_cap: float | None
+
+
+@dataclass(slots=True, frozen=True)
+class PairDesc:
+    """A configured coin/currency pair and its keys in the API response."""
+
+    pair: str
+    coin_id: str
+    currency_lower: str
+    currency_upper: str
+    k_change: str
+    k_vol: str
+    k_mcap: str
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry) -> PairDesc:
+        """Parse the pair configured in a config entry."""
+        coin_id = entry.data.get(CONF_COIN_ID, "bitcoin").lower()
+        currency = entry.data.get(CONF_CURRENCY, "aud").lower()
+
+        return cls(
+            # Interned so sensor lookups of the key hit on identity
+            pair=sys.intern(f"{coin_id.upper()}{currency.upper()}"),
+            coin_id=coin_id,
+            currency_lower=currency,
+            currency_upper=currency.upper(),
+            k_change=f"{currency}_24h_change",
+            k_vol=f"{currency}_24h_vol",
+            k_mcap=f"{currency}_market_cap",
+        )
+
+
+# Configured pairs grouped by coin id, fixed until an entry is added or removed
+_DemuxPlan = tuple[tuple[str, tuple[PairDesc, ...]], ...]
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up CoinGecko from a config entry."""
-    coordinator = CoinGeckoDataUpdateCoordinator(hass, entry)
-    
-    # Try to refresh data, but don't fail setup if it doesn't work initially
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        _LOGGER.warning("Failed to refresh data on setup: %s", err)
-        # Continue with setup even if initial refresh fails
-
     hass.data.setdefault(DOMAIN, {})
+
+    # All entries share one coordinator so every pair is fetched in one request
+    coordinator: CoinGeckoDataUpdateCoordinator | None = hass.data[DOMAIN].get(DATA_COORDINATOR)
+    if coordinator is None:
+        coordinator = CoinGeckoDataUpdateCoordinator(hass)
+        hass.data[DOMAIN][DATA_COORDINATOR] = coordinator
+
+    coordinator.async_register_entry(entry)
+
+    # Try to refresh data, but don't fail setup if it doesn't work initially.
+    # Requests are debounced so entries set up together share one fetch.
+    await coordinator.async_request_refresh()
+
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -52,89 +120,301 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
-        await coordinator.async_close()
+        coordinator.async_unregister_entry(entry)
+
+        # Tear down the shared coordinator once the last entry is gone
+        if not coordinator.has_entries:
+            hass.data[DOMAIN].pop(DATA_COORDINATOR)
+            await coordinator.async_shutdown()
 
     return unload_ok
 
 
-class CoinGeckoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Class to manage fetching CoinGecko data."""
+class CoinGeckoDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Quote]]):
+    """Class to manage fetching CoinGecko data for all config entries."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant) -> None:
         """Initialize."""
-        self.entry = entry
-        self.session: aiohttp.ClientSession | None = None
-        
-        scan_interval = entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-        
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=scan_interval),
+        # Shared Home Assistant session so every entry reuses one keep-alive pool
+        self.session = async_get_clientsession(hass)
+        self._pairs: dict[str, tuple[PairDesc, ...]] = {}
+        self._scan_intervals: dict[str, int] = {}
+
+        # Derived from the registered pairs whenever they change
+        self._demux_plan: _DemuxPlan = ()
+        self._url = _SIMPLE_PRICE_URL
+        self._cache_key = ""
+        self._cache = _PriceCache()
+        self._revalidating = False
+        self._poll_interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+        # A single interval timer drives refreshes for every entry, so the
+        # coordinator's own per-refresh scheduling is disabled
+        self._timer_interval: timedelta | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+        # Stamped when prices are actually fetched, before listeners run, so
+        # cache hits and stale serves do not count as successful updates
+        self.last_update_success_time: datetime | None = None
+
+        # ISO string of last_update_success_time, formatted once per update
+        self._last_update_iso: str | None = None
+
+        # The coordinator is shared by every entry, so it must not be bound to
+        # the entry being set up: DataUpdateCoordinator would otherwise shut it
+        # down as soon as that one entry unloads
+        token = current_entry.set(None)
+        try:
+            super().__init__(
+                hass,
+                _LOGGER,
+                name=DOMAIN,
+                update_interval=None,
+            )
+        finally:
+            current_entry.reset(token)
+
+    @property
+    def has_entries(self) -> bool:
+        """Return True if any config entry is registered."""
+        return bool(self._pairs)
+
+    @property
+    def last_update_iso(self) -> str | None:
+        """Return the time of the last successful update as an ISO string."""
+        return self._last_update_iso
+
+    def entry_pairs(self, entry_id: str) -> tuple[PairDesc, ...]:
+        """Return the pairs registered by a config entry."""
+        return self._pairs.get(entry_id, ())
+
+    @callback
+    def async_register_entry(self, entry: ConfigEntry) -> None:
+        """Add the pairs of a config entry to the batch."""
+        self._pairs[entry.entry_id] = (PairDesc.from_entry(entry),)
+        self._scan_intervals[entry.entry_id] = entry.data.get(
+            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+        )
+        self._async_update_pairs()
+
+    @callback
+    def async_unregister_entry(self, entry: ConfigEntry) -> None:
+        """Remove the pairs of a config entry from the batch."""
+        self._pairs.pop(entry.entry_id, None)
+        self._scan_intervals.pop(entry.entry_id, None)
+        self._async_update_pairs()
+
+    @callback
+    def _async_update_pairs(self) -> None:
+        """Rebuild the request parameters and interval for the registered pairs."""
+        pairs = {pair for entry_pairs in self._pairs.values() for pair in entry_pairs}
+
+        # One request covers every coin and currency; the response holds
+        # the full cross product, from which only configured pairs are kept
+        ids = ",".join(sorted({pair.coin_id for pair in pairs}))
+        vs_currencies = ",".join(sorted({pair.currency_lower for pair in pairs}))
+        self._url = _SIMPLE_PRICE_URL.with_query(
+            ids=ids,
+            vs_currencies=vs_currencies,
+            include_24hr_change="true",
+            include_24hr_vol="true",
+            include_market_cap="true",
+        )
+        self._cache_key = f"{ids}|{vs_currencies}"
+
+        # Group pairs by coin so each coin is looked up once per response
+        pairs_by_coin: dict[str, list[PairDesc]] = {}
+        for pair in pairs:
+            pairs_by_coin.setdefault(pair.coin_id, []).append(pair)
+        self._demux_plan = tuple(
+            (coin_id, tuple(coin_pairs)) for coin_id, coin_pairs in pairs_by_coin.items()
         )
 
-    async def _async_update_data(self) -> dict[str, Any]:
+        # Poll at the shortest interval requested by any entry, jittered by
+        # up to 5% so restarted instances do not all hit the API on one tick
+        if self._scan_intervals:
+            scan_interval = min(self._scan_intervals.values())
+            self._poll_interval = timedelta(
+                seconds=scan_interval * (1 + random.uniform(-0.05, 0.05))
+            )
+            self._async_start_timer(self._poll_interval)
+        else:
+            self._async_stop_timer()
+
+    @callback
+    def _async_start_timer(self, interval: timedelta) -> None:
+        """(Re)start the polling timer with the given interval."""
+        self._async_stop_timer()
+        self._timer_interval = interval
+        self._unsub_timer = async_track_time_interval(
+            self.hass, self._async_handle_timer, interval
+        )
+
+    @callback
+    def _async_stop_timer(self) -> None:
+        """Cancel the polling timer."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._timer_interval = None
+
+    @callback
+    def _async_set_interval(self, interval: timedelta) -> None:
+        """Change the interval of a running polling timer."""
+        if self._unsub_timer is not None and interval != self._timer_interval:
+            self._async_start_timer(interval)
+
+    async def _async_handle_timer(self, now: datetime) -> None:
+        """Refresh all pairs on each timer tick."""
+        # Scheduled refreshes are skipped while Home Assistant is stopping
+        await self._async_refresh(log_failures=True, scheduled=True)
+
+    async def async_shutdown(self) -> None:
+        """Cancel the polling timer and shut down the coordinator."""
+        # Other entries still depend on the shared timer and refreshes
+        if self.has_entries:
+            return
+
+        self._async_stop_timer()
+        await super().async_shutdown()
+
+    @callback
+    def _async_mark_updated(self) -> None:
+        """Record that prices were just fetched from the API."""
+        self.last_update_success_time = dt_util.utcnow()
+        self._last_update_iso = self.last_update_success_time.isoformat()
+
+    async def _async_update_data(self) -> dict[str, Quote]:
         """Update data via library."""
+        plan = self._demux_plan
+        if not plan:
+            return {}
+
+        url = self._url
+        cache_key = self._cache_key
+
+        # Serve fresh responses from the cache, and stale ones while a
+        # background request revalidates them
+        if (cached := self._cache.get(cache_key)) is not None:
+            age, data = cached
+            if age < CACHE_TTL_PRICE:
+                return self._process_data(plan, data)
+            if age < CACHE_TTL_STALE:
+                if not self._revalidating:
+                    self._revalidating = True
+                    self.hass.async_create_background_task(
+                        self._async_revalidate(url, cache_key),
+                        f"{DOMAIN} price revalidation",
+                    )
+                return self._process_data(plan, data)
+
+        data = await self._async_fetch(url)
+        self._cache.set(cache_key, data)
+        self._async_mark_updated()
+        return self._process_data(plan, data)
+
+    async def _async_revalidate(self, url: yarl.URL, cache_key: str) -> None:
+        """Refresh a stale cache entry and push the result to listeners."""
+        try:
+            data = await self._async_fetch(url)
+        except UpdateFailed as err:
+            _LOGGER.warning("Background refresh of cached prices failed: %s", err)
+            return
+        finally:
+            self._revalidating = False
+
+        self._cache.set(cache_key, data)
+
+        # Entries may have been added or removed while the request was in
+        # flight; the next refresh will fetch the new set of pairs
+        if cache_key != self._cache_key:
+            return
+
+        self._async_mark_updated()
+        self.async_set_updated_data(self._process_data(self._demux_plan, data))
+
+    async def _async_fetch(self, url: yarl.URL) -> dict[str, Any]:
+        """Request prices from the CoinGecko API."""
         try:
-            coin_id = self.entry.data.get(CONF_COIN_ID, "bitcoin")
-            currency = self.entry.data.get(CONF_CURRENCY, "aud")
-            
-            if not coin_id or not currency:
-                raise UpdateFailed("Coin ID and currency must be configured")
-            
-            # Create session if it doesn't exist
-            if self.session is None:
-                timeout = aiohttp.ClientTimeout(total=30)
-                self.session = aiohttp.ClientSession(timeout=timeout)
-            
-            # Make API request
-            url = f"{API_BASE_URL}{SIMPLE_PRICE_ENDPOINT}"
-            params = {
-                "ids": coin_id.lower(),
-                "vs_currencies": currency.lower(),
-                "include_24hr_change": "true",
-                "include_24hr_vol": "true",
-                "include_market_cap": "true",
-            }
-            
-            async with self.session.get(url, params=params) as response:
+            response = await self.session.get(url, timeout=_REQUEST_TIMEOUT)
+            try:
+                if response.status == 429:
+                    # Back off for as long as the API asks, but never poll
+                    # faster than the configured interval
+                    try:
+                        retry_after = int(response.headers.get("Retry-After", 0))
+                    except ValueError:
+                        retry_after = 0
+                    backoff = max(timedelta(seconds=retry_after), self._poll_interval)
+                    self._async_set_interval(backoff)
+                    raise UpdateFailed(
+                        f"Rate limited by CoinGecko API, retrying in {backoff}"
+                    )
+
                 if response.status != 200:
                     raise UpdateFailed(f"API request failed with status {response.status}")
-                
-                try:
-                    data = await response.json()
-                except aiohttp.ContentTypeError as err:
-                    raise UpdateFailed(f"Invalid JSON response from API: {err}")
-                except Exception as err:
-                    raise UpdateFailed(f"Failed to parse API response: {err}")
-                
-                # Process and structure the data
-                processed_data = {}
-                coin_id_lower = coin_id.lower()
-                currency_lower = currency.lower()
-                
-                if coin_id_lower in data:
-                    coin_data = data[coin_id_lower]
-                    if currency_lower in coin_data:
-                        processed_data[f"{coin_id.upper()}{currency.upper()}"] = {
-                            "price": coin_data[currency_lower],
-                            "coin_id": coin_id_lower,
-                            "currency": currency.upper(),
-                            "change_24h": coin_data.get(f"{currency_lower}_24h_change"),
-                            "volume_24h": coin_data.get(f"{currency_lower}_24h_vol"),
-                            "market_cap": coin_data.get(f"{currency_lower}_market_cap"),
-                        }
-                
-                return processed_data
-                
-        except aiohttp.ClientError as err:
+
+                data = await response.json(loads=orjson.loads)
+            finally:
+                response.release()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             raise UpdateFailed(f"Error communicating with CoinGecko API: {err}")
-        except Exception as err:
-            raise UpdateFailed(f"Unexpected error: {err}")
-
-    async def async_close(self) -> None:
-        """Close the session."""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        except orjson.JSONDecodeError as err:
+            raise UpdateFailed(f"Invalid JSON response from API: {err}")
+
+        # Resume the normal cadence after a rate-limit backoff
+        self._async_set_interval(self._poll_interval)
+        return data
+
+    @staticmethod
+    def _process_data(plan: _DemuxPlan, data: dict[str, Any]) -> dict[str, Quote]:
+        """Process and structure the data for the configured pairs."""
+        processed_data = {}
+
+        for coin_id, coin_pairs in plan:
+            if not (coin_data := data.get(coin_id)):
+                continue
+
+            for pair in coin_pairs:
+                if pair.currency_lower in coin_data:
+                    # Round once here rather than on every attribute read
+                    change_24h = coin_data.get(pair.k_change)
+                    if change_24h is not None:
+                        change_24h = round(change_24h, 2)
+
+                    processed_data[pair.pair] = Quote(
+                        price=coin_data[pair.currency_lower],
+                        coin_id=coin_id,
+                        currency=pair.currency_upper,
+                        change_24h=change_24h,
+                        volume_24h=coin_data.get(pair.k_vol),
+                        market_cap=coin_data.get(pair.k_mcap),
+                    )
+
+        return processed_data
+
+
+class _PriceCache:
+    """In-memory cache of raw price responses keyed by requested ids."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._entries: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    def get(self, key: str) -> tuple[float, dict[str, Any]] | None:
+        """Return the age in seconds and the cached response for key."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        stored_at, data = entry
+        return time.monotonic() - stored_at, data
+
+    def set(self, key: str, data: dict[str, Any]) -> None:
+        """Store a response, dropping entries too old to be served."""
+        now = time.monotonic()
+        self._entries = {
+            cached_key: entry
+            for cached_key, entry in self._entries.items()
+            if now - entry[0] < CACHE_TTL_STALE
+        }
+        self._entries[key] = (now, data)
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+import re
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
@@ -20,6 +22,15 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# CoinGecko coin ids (e.g. bitcoin, usd-coin) and vs currencies (e.g. usd, sats)
+_COIN_ID_RE = re.compile(r"\A[a-z0-9][a-z0-9._-]*\Z")
+_CURRENCY_RE = re.compile(r"\A[a-z]+\Z")
+
+_ERRORS_NO_COIN_ID = {"base": "no_coin_id"}
+_ERRORS_NO_CURRENCY = {"base": "no_currency"}
+_ERRORS_INVALID_COIN_ID = {"base": "invalid_coin_id"}
+_ERRORS_INVALID_CURRENCY = {"base": "invalid_currency"}
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
@@ -30,15 +41,47 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
-STEP_OPTIONS_DATA_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
-            vol.Coerce(int), vol.Range(min=60, max=86400)
-        ),
-        vol.Required(CONF_COIN_ID, default="bitcoin"): str,
-        vol.Required(CONF_CURRENCY, default="aud"): str,
-    }
-)
+
+def _options_schema(current_data: Mapping[str, Any]) -> vol.Schema:
+    """Return the options schema pre-populated with the current values."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_SCAN_INTERVAL,
+                default=current_data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
+            vol.Required(
+                CONF_COIN_ID,
+                default=current_data.get(CONF_COIN_ID, "bitcoin"),
+            ): str,
+            vol.Required(
+                CONF_CURRENCY,
+                default=current_data.get(CONF_CURRENCY, "aud"),
+            ): str,
+        }
+    )
+
+
+def _validate_input(
+    user_input: dict[str, Any]
+) -> tuple[str, str, dict[str, str] | None]:
+    """Normalize the coin ID and currency and return them with any form errors."""
+    coin_id = user_input[CONF_COIN_ID].strip().lower()
+    currency = user_input[CONF_CURRENCY].strip().lower()
+
+    if not coin_id:
+        return coin_id, currency, _ERRORS_NO_COIN_ID
+
+    if not currency:
+        return coin_id, currency, _ERRORS_NO_CURRENCY
+
+    if not _COIN_ID_RE.match(coin_id):
+        return coin_id, currency, _ERRORS_INVALID_COIN_ID
+
+    if not _CURRENCY_RE.match(currency):
+        return coin_id, currency, _ERRORS_INVALID_CURRENCY
+
+    return coin_id, currency, None
 
 
 class CoinGeckoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -55,22 +98,12 @@ class CoinGeckoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 step_id="user", data_schema=STEP_USER_DATA_SCHEMA
             )
 
-        # Validate coin ID and currency
-        coin_id = user_input[CONF_COIN_ID].strip().lower()
-        currency = user_input[CONF_CURRENCY].strip().lower()
-        
-        if not coin_id:
-            return self.async_show_form(
-                step_id="user",
-                data_schema=STEP_USER_DATA_SCHEMA,
-                errors={"base": "no_coin_id"},
-            )
-        
-        if not currency:
+        coin_id, currency, errors = _validate_input(user_input)
+        if errors:
             return self.async_show_form(
                 step_id="user",
                 data_schema=STEP_USER_DATA_SCHEMA,
-                errors={"base": "no_currency"},
+                errors=errors,
             )
 
         return self.async_create_entry(
@@ -98,23 +131,16 @@ class CoinGeckoOptionsFlow(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        # Pre-populate with current values
+        schema = _options_schema(self.config_entry.data)
+
         if user_input is not None:
-            # Validate coin ID and currency
-            coin_id = user_input[CONF_COIN_ID].strip().lower()
-            currency = user_input[CONF_CURRENCY].strip().lower()
-            
-            if not coin_id:
-                return self.async_show_form(
-                    step_id="init",
-                    data_schema=STEP_OPTIONS_DATA_SCHEMA,
-                    errors={"base": "no_coin_id"},
-                )
-            
-            if not currency:
+            coin_id, currency, errors = _validate_input(user_input)
+            if errors:
                 return self.async_show_form(
                     step_id="init",
-                    data_schema=STEP_OPTIONS_DATA_SCHEMA,
-                    errors={"base": "no_currency"},
+                    data_schema=schema,
+                    errors=errors,
                 )
 
             return self.async_create_entry(
@@ -126,24 +152,6 @@ class CoinGeckoOptionsFlow(config_entries.OptionsFlow):
                 },
             )
 
-        # Pre-populate with current values
-        current_data = self.config_entry.data
-        schema = STEP_OPTIONS_DATA_SCHEMA.extend(
-            {
-                vol.Required(
-                    CONF_SCAN_INTERVAL, default=current_data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-                ): vol.All(vol.Coerce(int), vol.Range(min=60, max=86400)),
-                vol.Required(
-                    CONF_COIN_ID,
-                    default=current_data.get(CONF_COIN_ID, "bitcoin"),
-                ): str,
-                vol.Required(
-                    CONF_CURRENCY,
-                    default=current_data.get(CONF_CURRENCY, "aud"),
-                ): str,
-            }
-        )
-
         return self.async_show_form(step_id="init", data_schema=schema)
 
 
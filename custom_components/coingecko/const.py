@@ -11,3 +11,11 @@ SIMPLE_PRICE_ENDPOINT = "/simple/price"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_COIN_ID = "coin_id"
 CONF_CURRENCY = "currency"
+
+# hass.data key of the coordinator shared by all config entries
+DATA_COORDINATOR = "coordinator"
+
+# Price cache: responses younger than CACHE_TTL_PRICE are served as is,
+# older ones up to CACHE_TTL_STALE are served while refreshed in background
+CACHE_TTL_PRICE = 55  # seconds, just under the free-tier one minute cadence
+CACHE_TTL_STALE = 120  # seconds
@@ -2,18 +2,30 @@
 from __future__ import annotations
 
 import logging
+import sys
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_COIN_ID, CONF_CURRENCY
+from . import Quote
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Quote fields exposed as attributes only when CoinGecko returns them
+_OPTIONAL_KEYS = ("change_24h", "volume_24h", "market_cap")
+
+
+@lru_cache(maxsize=128)
+def _entity_names(trading_pair: str) -> tuple[str, str]:
+    """Return the entity name and unique id of a trading pair."""
+    return "CoinGecko " + trading_pair, "coingecko_" + trading_pair.lower()
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,68 +35,80 @@ async def async_setup_entry(
     """Set up CoinGecko sensor entities."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    coin_id = config_entry.data.get(CONF_COIN_ID, "bitcoin")
-    currency = config_entry.data.get(CONF_CURRENCY, "aud")
-    
-    # Create a single sensor for the coin/currency pair
-    trading_pair = f"{coin_id.upper()}{currency.upper()}"
-    entity = CoinGeckoSensor(coordinator, trading_pair)
-    
-    async_add_entities([entity])
+    # Create a sensor for each coin/currency pair registered by the entry
+    async_add_entities(
+        [
+            CoinGeckoSensor(coordinator, pair.pair)
+            for pair in coordinator.entry_pairs(config_entry.entry_id)
+        ]
+    )
 
 
 class CoinGeckoSensor(CoordinatorEntity, SensorEntity):
     """Representation of a CoinGecko sensor."""
 
+    # The Home Assistant base classes keep their own __dict__ (which holds
+    # the _attr_* values); only this sensor's own fields are slotted
+    __slots__ = ("_trading_pair", "_quote", "_was_available")
+
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_attribution = "Data provided by CoinGecko"
+
     def __init__(self, coordinator, trading_pair: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._trading_pair = trading_pair
-        self._attr_name = f"CoinGecko {trading_pair}"
-        self._attr_unique_id = f"coingecko_{trading_pair.lower()}"
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_attribution = "Data provided by CoinGecko"
+        self._trading_pair = sys.intern(trading_pair)
+        self._attr_name, self._attr_unique_id = _entity_names(trading_pair)
+        self._rebuild_state()
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        if not self.coordinator.data or self._trading_pair not in self.coordinator.data:
-            return None
-        
-        data = self.coordinator.data[self._trading_pair]
-        return data.get("price")
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new state only if the quote or availability changed."""
+        # Skip no-op writes (and the recorder/listener work behind them)
+        # when CoinGecko returns the same figures as the previous poll
+        if self._pair_data() == self._quote and self.available == self._was_available:
+            return
 
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return the unit of measurement."""
-        if not self.coordinator.data or self._trading_pair not in self.coordinator.data:
-            return None
-        
-        data = self.coordinator.data[self._trading_pair]
-        return data.get("currency")
+        self._rebuild_state()
+        super()._handle_coordinator_update()
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data or self._trading_pair not in self.coordinator.data:
+    def _pair_data(self) -> Quote | None:
+        """Return the latest quote of this sensor's trading pair."""
+        data = self.coordinator.data
+        return data.get(self._trading_pair) if data else None
+
+    def _rebuild_state(self) -> None:
+        """Compute the state and attributes once per coordinator update."""
+        data = self._pair_data()
+        self._quote = data
+        self._was_available = self.available
+        self._attr_native_value = data.price if data else None
+        self._attr_native_unit_of_measurement = data.currency if data else None
+        self._attr_extra_state_attributes = self._compute_attributes(data)
+
+    def _compute_attributes(self, data: Quote | None) -> dict[str, Any]:
+        """Build the state attributes from a quote."""
+        if data is None:
             return {}
         
-        data = self.coordinator.data[self._trading_pair]
-        
         attributes = {
-            "coin_id": data.get("coin_id"),
-            "currency": data.get("currency"),
-            "last_updated": self.coordinator.last_update_success.isoformat() if hasattr(self.coordinator.last_update_success, 'isoformat') else None,
+            "coin_id": data.coin_id,
+            "currency": data.currency,
+            "last_updated": self.coordinator.last_update_iso,
         }
         
         # Add optional attributes if available
-        if change_24h := data.get("change_24h"):
-            attributes["change_24h"] = round(change_24h, 2)
-        
-        if volume_24h := data.get("volume_24h"):
-            attributes["volume_24h"] = volume_24h
-        
-        if market_cap := data.get("market_cap"):
-            attributes["market_cap"] = market_cap
+        attributes.update(
+            {
+                key: value
+                for key in _OPTIONAL_KEYS
+                if (value := getattr(data, key)) is not None
+            }
+        )
         
         return attributes
+
+    @property
+    def available(self) -> bool:
+        """Return True if the last update returned a quote for this pair."""
+        return super().available and self._pair_data() is not None
@@ -0,0 +1,161 @@
+"""Tests for the CoinGecko integration setup."""
+from datetime import timedelta
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.coingecko.const import (
+    API_BASE_URL,
+    CONF_COIN_ID,
+    CONF_CURRENCY,
+    CONF_SCAN_INTERVAL,
+    DATA_COORDINATOR,
+    DOMAIN,
+    SIMPLE_PRICE_ENDPOINT,
+)
+
+PRICE_URL = f"{API_BASE_URL}{SIMPLE_PRICE_ENDPOINT}"
+
+
+def _mock_prices(aioclient_mock: AiohttpClientMocker, btc_aud: float, eth_usd: float) -> None:
+    """Serve the given prices from the simple price endpoint."""
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(
+        PRICE_URL,
+        json={"bitcoin": {"aud": btc_aud}, "ethereum": {"usd": eth_usd}},
+    )
+
+
+def _entry(coin_id: str, currency: str) -> MockConfigEntry:
+    """Return a config entry for a coin/currency pair."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_SCAN_INTERVAL: 900, CONF_COIN_ID: coin_id, CONF_CURRENCY: currency},
+    )
+
+
+async def test_reload_first_entry_keeps_shared_coordinator(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, freezer
+) -> None:
+    """Reloading the entry that created the coordinator keeps the others polling."""
+    _mock_prices(aioclient_mock, 100.0, 2.0)
+
+    entry_a = _entry("bitcoin", "aud")
+    entry_a.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry_a.entry_id)
+    await hass.async_block_till_done()
+
+    entry_b = _entry("ethereum", "usd")
+    entry_b.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry_b.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][DATA_COORDINATOR]
+
+    assert await hass.config_entries.async_unload(entry_a.entry_id)
+    await hass.async_block_till_done()
+    assert entry_b.state is ConfigEntryState.LOADED
+    assert hass.data[DOMAIN][DATA_COORDINATOR] is coordinator
+
+    assert await hass.config_entries.async_setup(entry_a.entry_id)
+    await hass.async_block_till_done()
+
+    # Move past the poll interval and the price cache so the tick fetches
+    _mock_prices(aioclient_mock, 200.0, 3.0)
+    freezer.tick(timedelta(seconds=1000))
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 1
+    assert hass.states.get("sensor.coingecko_bitcoinaud").state == "200.0"
+    assert hass.states.get("sensor.coingecko_ethereumusd").state == "3.0"
+
+    # The attribute reflects this fetch, not the previous one
+    fetched_at = dt_util.utcnow().isoformat()
+    assert coordinator.last_update_success_time.isoformat() == fetched_at
+    for entity_id in ("sensor.coingecko_bitcoinaud", "sensor.coingecko_ethereumusd"):
+        assert hass.states.get(entity_id).attributes["last_updated"] == fetched_at
+
+
+async def test_unload_last_entry_tears_down_coordinator(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """The shared coordinator is removed with the last entry."""
+    _mock_prices(aioclient_mock, 100.0, 2.0)
+
+    entry = _entry("bitcoin", "aud")
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.coingecko_bitcoinaud").state == "100.0"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert DATA_COORDINATOR not in hass.data[DOMAIN]
+
+
+async def test_stale_serve_keeps_last_update_time(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, freezer
+) -> None:
+    """Serving stale prices is not a successful update until revalidated."""
+    _mock_prices(aioclient_mock, 100.0, 2.0)
+
+    entry = _entry("bitcoin", "aud")
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][DATA_COORDINATOR]
+    fetched_at = coordinator.last_update_success_time
+
+    # Inside the stale window, with a failing revalidation
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(PRICE_URL, status=500)
+    freezer.tick(timedelta(seconds=60))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 1
+    assert coordinator.last_update_success_time == fetched_at
+    state = hass.states.get("sensor.coingecko_bitcoinaud")
+    assert state.state == "100.0"
+    assert state.attributes["last_updated"] == fetched_at.isoformat()
+
+    # A successful revalidation publishes fresh prices and stamps the time
+    _mock_prices(aioclient_mock, 200.0, 3.0)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 1
+    assert coordinator.last_update_success_time == dt_util.utcnow()
+    state = hass.states.get("sensor.coingecko_bitcoinaud")
+    assert state.state == "200.0"
+    assert state.attributes["last_updated"] == dt_util.utcnow().isoformat()
+
+
+async def test_no_refresh_while_stopping(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker, freezer
+) -> None:
+    """A timer tick during shutdown does not request prices."""
+    _mock_prices(aioclient_mock, 100.0, 2.0)
+
+    entry = _entry("bitcoin", "aud")
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    _mock_prices(aioclient_mock, 200.0, 3.0)
+    hass.set_state(CoreState.stopping)
+    freezer.tick(timedelta(seconds=1000))
+    async_fire_time_changed(hass, dt_util.utcnow())
+    await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 0